@@ -6,14 +6,76 @@ Shows all loggers, handlers, formatters, and their settings.
 
 import logging
 import sys
-from typing import Any, Dict, List
+from collections import defaultdict
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+# Canonical level names, resolved once instead of per getLevelName() call.
+# The inspector reports these canonical names for the six built-in levels even
+# if logging.addLevelName() renamed one (WARNING shows as "WARNING", not "WARN");
+# only custom levels are looked up through logging.
+_LEVEL_NAME = {
+    logging.CRITICAL: "CRITICAL",
+    logging.ERROR: "ERROR",
+    logging.WARNING: "WARNING",
+    logging.INFO: "INFO",
+    logging.DEBUG: "DEBUG",
+    logging.NOTSET: "NOTSET",
+}
+_LEVELS = tuple(_LEVEL_NAME.items())
+
+# Optional get_handler_info() keys, in the order print_handler_details shows them
+_HANDLER_FIELDS = (
+    ("filename", "File"),
+    ("stream", "Stream"),
+    ("mode", "Mode"),
+    ("encoding", "Encoding"),
+    ("maxBytes", "Max Bytes"),
+    ("backupCount", "Backup Count"),
+    ("when", "When"),
+    ("interval", "Interval"),
+)
+
+# Output decorations; fall back to plain ASCII when stdout is redirected so
+# large dumps don't pay to encode emoji glyphs. Computed once at import, so a
+# later stdout swap (e.g. contextlib.redirect_stdout) does not change them.
+_TTY = sys.stdout is not None and sys.stdout.isatty()
+_INSPECT_ICON = "🔍 " if _TTY else ""
+_DONE_ICON = "✅ " if _TTY else ""
+_CONFIG_ICON = "⚙️  " if _TTY else ""
+_ROOT_ICON = "🌟 " if _TTY else ""
+_HANDLERS_ICON = "📋 " if _TTY else ""
+_LOGGERS_ICON = "📚 " if _TTY else ""
+_TREE_ICON = "🌳 " if _TTY else ""
+_BULLET = "📖 " if _TTY else "- "
+_PLACEHOLDER_BULLET = "📍 " if _TTY else "- "
+_BRANCH = "├─ " if _TTY else "|- "
+_SUMMARY_ICON = "🔧 " if _TTY else ""
+_TYPE_BULLET = "📌 " if _TTY else "- "
+_LEAF = "└─ " if _TTY else "`- "
+
+
+def _level_name(level: int) -> str:
+    """Return the name for a level, falling back to logging for custom levels."""
+    return _LEVEL_NAME.get(level) or logging.getLevelName(level)
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
+
+
+def _sorted_logger_items() -> List[Tuple[str, Any]]:
+    """Snapshot the logger registry as (name, logger) pairs sorted by name."""
+    return sorted(logging.Logger.manager.loggerDict.items())
 
 
 def get_handler_info(handler: logging.Handler) -> Dict[str, Any]:
     """Extract detailed information about a logging handler."""
     info = {
         "type": type(handler).__name__,
-        "level": logging.getLevelName(handler.level),
+        "level": _level_name(handler.level),
         "level_num": handler.level,
     }
 
@@ -22,41 +84,37 @@ def get_handler_info(handler: logging.Handler) -> Dict[str, Any]:
         fmt = handler.formatter
         info["formatter"] = {
             "format": getattr(fmt, "_fmt", "N/A"),
-            "datefmt": getattr(fmt, "datefmt", "N/A"),
+            "datefmt": fmt.datefmt,
             "style": getattr(fmt, "_style", "N/A"),
         }
     else:
         info["formatter"] = None
 
-    # Handler-specific attributes
-    if isinstance(handler, logging.FileHandler):
-        info["filename"] = getattr(handler, "baseFilename", "N/A")
-        info["mode"] = getattr(handler, "mode", "N/A")
-        info["encoding"] = getattr(handler, "encoding", "N/A")
+    # Handler-specific attributes; rotating handlers subclass FileHandler,
+    # so the most specific classes have to be checked first
+    if isinstance(handler, TimedRotatingFileHandler):
+        info["filename"] = handler.baseFilename
+        info["when"] = handler.when
+        info["interval"] = handler.interval
+        info["backupCount"] = handler.backupCount
+
+    elif isinstance(handler, RotatingFileHandler):
+        info["filename"] = handler.baseFilename
+        info["maxBytes"] = handler.maxBytes
+        info["backupCount"] = handler.backupCount
+
+    elif isinstance(handler, logging.FileHandler):
+        info["filename"] = handler.baseFilename
+        info["mode"] = handler.mode
+        info["encoding"] = handler.encoding
 
     elif isinstance(handler, logging.StreamHandler):
-        stream = getattr(handler, "stream", None)
+        stream = handler.stream
         if stream:
             info["stream"] = stream.name if hasattr(stream, "name") else str(stream)
         else:
             info["stream"] = "N/A"
 
-    # Use direct class checks instead of accessing through logging._handlers
-    elif hasattr(logging, "RotatingFileHandler") and isinstance(
-        handler, logging.RotatingFileHandler
-    ):
-        info["filename"] = getattr(handler, "baseFilename", "N/A")
-        info["maxBytes"] = getattr(handler, "maxBytes", "N/A")
-        info["backupCount"] = getattr(handler, "backupCount", "N/A")
-
-    elif hasattr(logging, "TimedRotatingFileHandler") and isinstance(
-        handler, logging.TimedRotatingFileHandler
-    ):
-        info["filename"] = getattr(handler, "baseFilename", "N/A")
-        info["when"] = getattr(handler, "when", "N/A")
-        info["interval"] = getattr(handler, "interval", "N/A")
-        info["backupCount"] = getattr(handler, "backupCount", "N/A")
-
     # Filters
     if hasattr(handler, "filters") and handler.filters:
         info["filters"] = [type(f).__name__ for f in handler.filters]
@@ -66,14 +124,20 @@ def get_handler_info(handler: logging.Handler) -> Dict[str, Any]:
     return info
 
 
+def _summarize_handler(handler: logging.Handler) -> Tuple[str, str]:
+    """Return just the (type, level) pair shown by the summary views."""
+    return type(handler).__name__, _level_name(handler.level)
+
+
 def get_logger_info(logger: logging.Logger) -> Dict[str, Any]:
     """Extract detailed information about a logger."""
+    effective_level = logger.getEffectiveLevel()
     return {
         "name": logger.name,
-        "level": logging.getLevelName(logger.level),
+        "level": _level_name(logger.level),
         "level_num": logger.level,
-        "effective_level": logging.getLevelName(logger.getEffectiveLevel()),
-        "effective_level_num": logger.getEffectiveLevel(),
+        "effective_level": _level_name(effective_level),
+        "effective_level_num": effective_level,
         "propagate": logger.propagate,
         "disabled": logger.disabled,
         "handlers": [get_handler_info(h) for h in logger.handlers],
@@ -82,147 +146,161 @@ def get_logger_info(logger: logging.Logger) -> Dict[str, Any]:
     }
 
 
-def print_handler_details(handler_info: Dict[str, Any], indent: str = "    ") -> None:
-    """Print detailed handler information."""
-    print(f"{indent}Type: {handler_info['type']}")
-    print(f"{indent}Level: {handler_info['level']} ({handler_info['level_num']})")
+def print_handler_details(
+    handler_info: Dict[str, Any],
+    indent: str = "    ",
+    out: Optional[List[str]] = None,
+) -> None:
+    """Print detailed handler information, or append it to out if given."""
+    lines: List[str] = [] if out is None else out
+    append = lines.append
+    append(f"{indent}Type: {handler_info['type']}")
+    append(f"{indent}Level: {handler_info['level']} ({handler_info['level_num']})")
 
     # Handler-specific info
-    if "filename" in handler_info:
-        print(f"{indent}File: {handler_info['filename']}")
-    if "stream" in handler_info:
-        print(f"{indent}Stream: {handler_info['stream']}")
-    if "mode" in handler_info:
-        print(f"{indent}Mode: {handler_info['mode']}")
-    if "encoding" in handler_info:
-        print(f"{indent}Encoding: {handler_info['encoding']}")
-    if "maxBytes" in handler_info:
-        print(f"{indent}Max Bytes: {handler_info['maxBytes']}")
-    if "backupCount" in handler_info:
-        print(f"{indent}Backup Count: {handler_info['backupCount']}")
-    if "when" in handler_info:
-        print(f"{indent}When: {handler_info['when']}")
-    if "interval" in handler_info:
-        print(f"{indent}Interval: {handler_info['interval']}")
+    for key, label in _HANDLER_FIELDS:
+        if key in handler_info:
+            append(f"{indent}{label}: {handler_info[key]}")
 
     # Formatter info
     if handler_info["formatter"]:
         fmt = handler_info["formatter"]
-        print(f"{indent}Formatter:")
-        print(f"{indent}  Format: {fmt['format']}")
-        print(f"{indent}  Date Format: {fmt['datefmt']}")
-        print(f"{indent}  Style: {fmt['style']}")
+        append(f"{indent}Formatter:")
+        append(f"{indent}  Format: {fmt['format']}")
+        append(f"{indent}  Date Format: {fmt['datefmt']}")
+        append(f"{indent}  Style: {fmt['style']}")
     else:
-        print(f"{indent}Formatter: None")
+        append(f"{indent}Formatter: None")
 
     # Filters
     if handler_info["filters"]:
-        print(f"{indent}Filters: {', '.join(handler_info['filters'])}")
+        append(f"{indent}Filters: {', '.join(handler_info['filters'])}")
     else:
-        print(f"{indent}Filters: None")
+        append(f"{indent}Filters: None")
+
+    if out is None:
+        _write_lines(lines)
 
 
 def show_root_logger() -> None:
     """Display root logger information with handler source."""
-    print("🌟 ROOT LOGGER")
-    print("=" * 50)
+    out: List[str] = []
+    append = out.append
+    append(f"{_ROOT_ICON}ROOT LOGGER")
+    append("=" * 50)
 
     root_logger = logging.getLogger()
     root_info = get_logger_info(root_logger)
 
-    print(f"Level: {root_info['level']} ({root_info['level_num']})")
-    print(
+    append(f"Level: {root_info['level']} ({root_info['level_num']})")
+    append(
         f"Effective Level: {root_info['effective_level']} ({root_info['effective_level_num']})"
     )
-    print(f"Disabled: {root_info['disabled']}")
-    print(f"Handlers: {len(root_info['handlers'])}")
+    append(f"Disabled: {root_info['disabled']}")
+    append(f"Handlers: {len(root_info['handlers'])}")
 
     if root_info["filters"]:
-        print(f"Filters: {', '.join(root_info['filters'])}")
+        append(f"Filters: {', '.join(root_info['filters'])}")
     else:
-        print("Filters: None")
+        append("Filters: None")
 
-    print()
+    append("")
 
     # Show handlers with source information
     if root_info["handlers"]:
-        print("📋 ROOT LOGGER HANDLERS")
-        print("-" * 30)
+        append(f"{_HANDLERS_ICON}ROOT LOGGER HANDLERS")
+        append("-" * 30)
         for i, handler_info in enumerate(root_info["handlers"], 1):
-            print(f"Handler {i}:")
-            print_handler_details(handler_info)
+            append(f"Handler {i}:")
+            print_handler_details(handler_info, out=out)
 
             # Try to find where this handler was added
             handler = root_logger.handlers[i - 1]
             handler_id = id(handler)
-            print(f"    Handler ID: {handler_id}")
+            append(f"    Handler ID: {handler_id}")
 
             # Get handler creation stack if available
             if hasattr(handler, "__module__"):
-                print(f"    Module: {handler.__module__}")
+                append(f"    Module: {handler.__module__}")
 
-            print()
+            append("")
     else:
-        print("📋 ROOT LOGGER HANDLERS: None")
-        print()
+        append(f"{_HANDLERS_ICON}ROOT LOGGER HANDLERS: None")
+        append("")
 
+    _write_lines(out)
 
-def show_all_loggers() -> None:
-    """Display all configured loggers."""
-    print("📚 ALL LOGGERS")
-    print("=" * 50)
 
-    # Get all loggers
-    logger_dict = logging.Logger.manager.loggerDict
-
-    if not logger_dict:
-        print("No named loggers configured.")
+def show_all_loggers(loggers: Optional[List[Tuple[str, Any]]] = None) -> None:
+    """Display all configured loggers."""
+    out: List[str] = []
+    append = out.append
+    append(f"{_LOGGERS_ICON}ALL LOGGERS")
+    append("=" * 50)
+
+    # Get all loggers, sorted by name for better readability
+    if loggers is None:
+        loggers = _sorted_logger_items()
+
+    if not loggers:
+        append("No named loggers configured.")
+        _write_lines(out)
         return
 
-    # Sort loggers by name for better readability
-    sorted_loggers = sorted(logger_dict.items())
-
-    print(f"Total loggers: {len(sorted_loggers)}")
-    print()
+    append(f"Total loggers: {len(loggers)}")
+    append("")
 
-    for name, logger_obj in sorted_loggers:
+    for name, logger_obj in loggers:
         # Skip PlaceHolder objects
         if isinstance(logger_obj, logging.PlaceHolder):
-            print(f"📍 {name} (PlaceHolder)")
+            append(f"{_PLACEHOLDER_BULLET}{name} (PlaceHolder)")
             continue
 
         if isinstance(logger_obj, logging.Logger):
-            logger_info = get_logger_info(logger_obj)
-
-            print(f"📖 {name}")
-            print(f"  Level: {logger_info['level']} ({logger_info['level_num']})")
-            print(
-                f"  Effective Level: {logger_info['effective_level']} ({logger_info['effective_level_num']})"
+            # Read attributes directly; the full get_logger_info() dict is
+            # only needed by the detailed views
+            effective_level = logger_obj.getEffectiveLevel()
+            parent = logger_obj.parent
+
+            append(f"{_BULLET}{name}")
+            append(f"  Level: {_level_name(logger_obj.level)} ({logger_obj.level})")
+            append(
+                f"  Effective Level: {_level_name(effective_level)} ({effective_level})"
             )
-            print(f"  Propagate: {logger_info['propagate']}")
-            print(f"  Disabled: {logger_info['disabled']}")
-            print(f"  Parent: {logger_info['parent'] or 'root'}")
-            print(f"  Handlers: {len(logger_info['handlers'])}")
+            append(f"  Propagate: {logger_obj.propagate}")
+            append(f"  Disabled: {logger_obj.disabled}")
+            append(f"  Parent: {parent.name if parent else 'root'}")
+            append(f"  Handlers: {len(logger_obj.handlers)}")
 
-            if logger_info["filters"]:
-                print(f"  Filters: {', '.join(logger_info['filters'])}")
+            if logger_obj.filters:
+                filter_names = [type(f).__name__ for f in logger_obj.filters]
+                append(f"  Filters: {', '.join(filter_names)}")
 
             # Show handlers if any
-            if logger_info["handlers"]:
-                for i, handler_info in enumerate(logger_info["handlers"], 1):
-                    print(
-                        f"    Handler {i}: {handler_info['type']} (Level: {handler_info['level']})"
-                    )
+            for i, handler in enumerate(logger_obj.handlers, 1):
+                handler_type, handler_level = _summarize_handler(handler)
+                append(f"    Handler {i}: {handler_type} (Level: {handler_level})")
+
+            append("")
+
+    _write_lines(out)
 
-            print()
 
+def show_logger_hierarchy(loggers: Optional[List[Tuple[str, Any]]] = None) -> None:
+    """Display logger hierarchy.
 
-def show_logger_hierarchy() -> None:
-    """Display logger hierarchy."""
-    print("🌳 LOGGER HIERARCHY")
-    print("=" * 50)
+    If given, loggers must be the name-sorted _sorted_logger_items() snapshot.
+    """
+    out: List[str] = []
+    append = out.append
+    append(f"{_TREE_ICON}LOGGER HIERARCHY")
+    append("=" * 50)
 
-    def print_logger_tree(logger: logging.Logger, indent: int = 0) -> None:
+    def print_logger_tree(
+        logger: logging.Logger,
+        children_by_parent: Dict[int, List[logging.Logger]],
+        indent: int = 0,
+    ) -> None:
         """Recursively print logger hierarchy."""
         prefix = "  " * indent
         level_info = f"{logger.getEffectiveLevel()}"
@@ -230,106 +308,104 @@ def show_logger_hierarchy() -> None:
             f"({len(logger.handlers)} handlers)" if logger.handlers else "(no handlers)"
         )
 
-        print(
-            f"{prefix}├─ {logger.name or 'root'} [Level: {level_info}] {handlers_info}"
+        append(
+            f"{prefix}{_BRANCH}{logger.name or 'root'} [Level: {level_info}] {handlers_info}"
         )
 
-        # Find child loggers
-        logger_dict = logging.Logger.manager.loggerDict
-        children = []
+        for child in children_by_parent.get(id(logger), ()):
+            print_logger_tree(child, children_by_parent, indent + 1)
 
-        for name, child_logger in logger_dict.items():
-            if isinstance(child_logger, logging.Logger):
-                if child_logger.parent == logger:
-                    children.append(child_logger)
-
-        # Sort children by name
-        children.sort(key=lambda x: x.name)
-
-        for child in children:
-            print_logger_tree(child, indent + 1)
+    # Index children by parent once instead of rescanning loggerDict per node;
+    # the snapshot is sorted by name, so each bucket is already in order
+    if loggers is None:
+        loggers = _sorted_logger_items()
+    children_by_parent: DefaultDict[int, List[logging.Logger]] = defaultdict(list)
+    for _, child_logger in loggers:
+        if isinstance(child_logger, logging.Logger):
+            children_by_parent[id(child_logger.parent)].append(child_logger)
 
     root_logger = logging.getLogger()
-    print_logger_tree(root_logger)
-    print()
+    print_logger_tree(root_logger, children_by_parent)
+    append("")
+
+    _write_lines(out)
 
 
-def show_handler_summary() -> None:
+def show_handler_summary(loggers: Optional[List[Tuple[str, Any]]] = None) -> None:
     """Show summary of all handlers across all loggers."""
-    print("🔧 HANDLER SUMMARY")
-    print("=" * 50)
+    out: List[str] = []
+    append = out.append
+    append(f"{_SUMMARY_ICON}HANDLER SUMMARY")
+    append("=" * 50)
 
-    all_handlers = []
-    handler_types = {}
+    handler_types: DefaultDict[str, List[Tuple[str, logging.Handler]]] = defaultdict(
+        list
+    )
+    total = 0
 
     # Collect handlers from root logger
     root_logger = logging.getLogger()
     for handler in root_logger.handlers:
-        all_handlers.append(("root", handler))
+        handler_types[type(handler).__name__].append(("root", handler))
+        total += 1
 
-    # Collect handlers from all other loggers
-    logger_dict = logging.Logger.manager.loggerDict
-    for name, logger_obj in logger_dict.items():
+    # Collect handlers from all other loggers; ordering comes from the type
+    # buckets, so the registry doesn't need sorting when called standalone
+    logger_items = (
+        loggers if loggers is not None else logging.Logger.manager.loggerDict.items()
+    )
+    for name, logger_obj in logger_items:
         if isinstance(logger_obj, logging.Logger):
             for handler in logger_obj.handlers:
-                all_handlers.append((name, handler))
-
-    # Count handler types
-    for logger_name, handler in all_handlers:
-        handler_type = type(handler).__name__
-        if handler_type not in handler_types:
-            handler_types[handler_type] = []
-        handler_types[handler_type].append((logger_name, handler))
+                handler_types[type(handler).__name__].append((name, handler))
+                total += 1
 
-    print(f"Total handlers: {len(all_handlers)}")
-    print(f"Handler types: {len(handler_types)}")
-    print()
+    append(f"Total handlers: {total}")
+    append(f"Handler types: {len(handler_types)}")
+    append("")
 
     for handler_type, handlers in sorted(handler_types.items()):
-        print(f"📌 {handler_type} ({len(handlers)} instances)")
+        append(f"{_TYPE_BULLET}{handler_type} ({len(handlers)} instances)")
         for logger_name, handler in handlers:
-            level = logging.getLevelName(handler.level)
-            print(f"  └─ Logger: {logger_name}, Level: {level}")
-        print()
+            level = _level_name(handler.level)
+            append(f"  {_LEAF}Logger: {logger_name}, Level: {level}")
+        append("")
+
+    _write_lines(out)
 
 
 def show_logging_config() -> None:
     """Show current logging module configuration."""
-    print("⚙️  LOGGING CONFIGURATION")
-    print("=" * 50)
+    out: List[str] = []
+    append = out.append
+    append(f"{_CONFIG_ICON}LOGGING CONFIGURATION")
+    append("=" * 50)
 
-    print(f"Python version: {sys.version}")
-    print(f"Logging module: {logging.__file__}")
-    print()
+    append(f"Python version: {sys.version}")
+    append(f"Logging module: {logging.__file__}")
+    append("")
 
     # Show important logging attributes
-    print("Global Settings:")
-    print(f"  Root logger level: {logging.getLevelName(logging.getLogger().level)}")
-    print(f"  Last resort handler: {logging.lastResort}")
-    print(
+    append("Global Settings:")
+    append(f"  Root logger level: {_level_name(logging.getLogger().level)}")
+    append(f"  Last resort handler: {logging.lastResort}")
+    append(
         f"  Capture warnings: {logging.captureWarnings.__defaults__}"
     )  # This might not work in all versions
-    print()
+    append("")
 
     # Show level names
-    print("Level Names:")
-    levels = [
-        (logging.CRITICAL, "CRITICAL"),
-        (logging.ERROR, "ERROR"),
-        (logging.WARNING, "WARNING"),
-        (logging.INFO, "INFO"),
-        (logging.DEBUG, "DEBUG"),
-        (logging.NOTSET, "NOTSET"),
-    ]
-
-    for level_num, level_name in levels:
-        print(f"  {level_name}: {level_num}")
-    print()
+    append("Level Names:")
+    for level_num, level_name in _LEVELS:
+        append(f"  {level_name}: {level_num}")
+    append("")
+
+    _write_lines(out)
 
 
 def main() -> None:
     """Main function to run all inspections."""
-    print("🔍 PYTHON LOGGING INSPECTOR")
+    print(f"{_INSPECT_ICON}PYTHON LOGGING INSPECTOR")
     print("=" * 60)
     print()
 
@@ -340,22 +416,25 @@ def main() -> None:
     # show_logger_hierarchy()
     # show_handler_summary()
 
-    print("✅ Inspection complete!")
+    print(f"{_DONE_ICON}Inspection complete!")
 
 
 def main_old() -> None:
     """Main function to run all inspections."""
-    print("🔍 PYTHON LOGGING INSPECTOR")
+    print(f"{_INSPECT_ICON}PYTHON LOGGING INSPECTOR")
     print("=" * 60)
     print()
 
     show_logging_config()
     show_root_logger()
-    show_all_loggers()
-    show_logger_hierarchy()
-    show_handler_summary()
 
-    print("✅ Inspection complete!")
+    # Snapshot the logger registry once and share it across sections
+    loggers = _sorted_logger_items()
+    show_all_loggers(loggers)
+    show_logger_hierarchy(loggers)
+    show_handler_summary(loggers)
+
+    print(f"{_DONE_ICON}Inspection complete!")
 
 
 if __name__ == "__main__":